@@ -0,0 +1,139 @@
+"""
+async_bot.py
+asyncio variant of BasicBot for placing many orders concurrently.
+Requires the optional aiohttp dependency; kept out of bot.py so the
+synchronous CLI does not import asyncio/aiohttp.
+"""
+
+import time
+import asyncio
+import logging
+import aiohttp
+from bot import _SignedClient, BASE_URL, ORDER_PATH, ACCOUNT_PATH, _FORM_HEADERS, _loads, logger
+
+
+class AsyncBasicBot(_SignedClient):
+    """
+    asyncio counterpart of BasicBot (requires aiohttp). Shares signing and
+    order building with BasicBot but every API method is a coroutine.
+    place_orders sends many orders concurrently over one keep-alive connection
+    pool. At most max_in_flight requests (orders and account queries) are in
+    flight at a time.
+
+    The aiohttp session belongs to the event loop that first used it; when the
+    bot is used from a new loop (e.g. a second asyncio.run()) a fresh session
+    is created. Use `async with AsyncBasicBot(...)` (or await close()) inside
+    each loop so its session is closed cleanly.
+    """
+
+    def __init__(self, api_key: str, api_secret: str, base_url: str = BASE_URL, recv_window: int = 5000, max_in_flight: int = 8):
+        super().__init__(api_key, api_secret, base_url=base_url, recv_window=recv_window)
+        self.max_in_flight = max_in_flight
+        # created lazily inside the running event loop
+        self._aio = None
+        self._in_flight = None
+        self._loop = None
+        logger.info("AsyncBasicBot initialized")
+
+    def _aio_session(self):
+        loop = asyncio.get_running_loop()
+        if self._aio is None or self._aio.closed or self._loop is not loop:
+            if self._aio is not None and not self._aio.closed:
+                # its loop is gone or different; it cannot be closed from here
+                logger.warning("Discarding aiohttp session bound to another event loop")
+            self._aio = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+                headers={"X-MBX-APIKEY": self.api_key},
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+            # cap concurrent requests to stay inside Binance rate limits
+            self._in_flight = asyncio.Semaphore(self.max_in_flight)
+            self._loop = loop
+        return self._aio
+
+    async def close(self):
+        if self._aio is not None and not self._aio.closed and self._loop is asyncio.get_running_loop():
+            await self._aio.close()
+        self._aio = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _send_post(self, path: str, sign):
+        url = f"{self.base_url}{path}"
+        session = self._aio_session()
+        # every order goes through here, so this caps all POSTs; signing inside
+        # the slot keeps queued orders from aging past recvWindow
+        async with self._in_flight:
+            qs, body = sign()
+            logger.debug("REQUEST POST %s?%s", url, qs)
+            self._order_sending()
+            try:
+                async with session.post(url, data=body, headers=_FORM_HEADERS) as resp:
+                    if logger.isEnabledFor(logging.DEBUG):  # see BOT_LOG_LEVEL in bot.py
+                        logger.debug("STATUS %s | RESPONSE %s", resp.status, await resp.text())
+                    resp.raise_for_status()
+                    return _loads(await resp.read())
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                logger.exception("Request failed: %s", str(e))
+                raise
+
+    async def place_market_order(self, symbol: str, side: str, quantity: float, reduce_only: bool = False, client_order_id: str = None):
+        signer = self._market_signer(symbol, side, quantity, reduce_only, client_order_id)
+        return await self._send_post(ORDER_PATH, signer)
+
+    async def place_limit_order(self, symbol: str, side: str, quantity: float, price: float, time_in_force: str = "GTC", client_order_id: str = None):
+        signer = self._limit_signer(symbol, side, quantity, price, time_in_force, client_order_id)
+        return await self._send_post(ORDER_PATH, signer)
+
+    async def place_stop_limit_order(self, symbol: str, side: str, quantity: float, stop_price: float, limit_price: float, time_in_force: str = "GTC", client_order_id: str = None):
+        signer = self._stop_limit_signer(symbol, side, quantity, stop_price, limit_price, time_in_force, client_order_id)
+        return await self._send_post(ORDER_PATH, signer)
+
+    async def get_account_info(self, force: bool = False):
+        """See BasicBot.get_account_info (same cache and TTL)"""
+        cached = self._cached_account(force)
+        if cached is not None:
+            return cached
+        url = f"{self.base_url}{ACCOUNT_PATH}"
+        session = self._aio_session()
+        async with self._in_flight:
+            qs, signed = self._signed_query({})
+            logger.debug("REQUEST GET %s?%s", url, qs)
+            started, orders_before = time.monotonic(), self._orders_sent
+            try:
+                async with session.get(f"{url}?{signed}") as resp:
+                    if logger.isEnabledFor(logging.DEBUG):  # see BOT_LOG_LEVEL in bot.py
+                        logger.debug("STATUS %s | RESPONSE %s", resp.status, await resp.text())
+                    resp.raise_for_status()
+                    data = _loads(await resp.read())
+                    self._store_account(started, orders_before, data)
+                    return data
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                logger.exception("Failed to fetch account info: %s", e)
+                raise
+
+    async def place_orders(self, specs: list):
+        """
+        Place several orders concurrently.
+        Each spec is a dict with "type" (MARKET / LIMIT / STOPLIMIT) plus the
+        keyword arguments of the matching place_* method, e.g.
+        {"type": "LIMIT", "symbol": "BTCUSDT", "side": "BUY", "quantity": 0.001, "price": 30000}.
+        Returns results in spec order; failed orders are returned as exceptions.
+        """
+        methods = {
+            "MARKET": self.place_market_order,
+            "LIMIT": self.place_limit_order,
+            "STOPLIMIT": self.place_stop_limit_order,
+        }
+        calls = []
+        for spec in specs:
+            kwargs = dict(spec)
+            order_type = kwargs.pop("type").upper()
+            if order_type not in methods:
+                raise ValueError(f"Unknown order type: {order_type}")
+            calls.append((methods[order_type], kwargs))
+        return await asyncio.gather(*(method(**kwargs) for method, kwargs in calls), return_exceptions=True)
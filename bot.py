@@ -5,12 +5,26 @@ Implements: market, limit, stop-limit (bonus).
 """
 
 import os
+import math
 import time
+import functools
+import itertools
 import hmac
 import hashlib
 import logging
+from logging.handlers import MemoryHandler
+from decimal import Decimal, InvalidOperation
 import requests
-from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlencode, quote_plus
+
+try:  # optional, faster JSON parsing straight from bytes
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
 
 # Read env vars (you can also import from dotenv)
 API_KEY = os.environ.get("BINANCE_API_KEY")
@@ -19,9 +33,17 @@ API_SECRET = os.environ.get("BINANCE_API_SECRET")
 # Testnet base URL for Binance Futures (USDT-M)
 BASE_URL = "https://testnet.binancefuture.com"
 
+ORDER_PATH = "/fapi/v1/order"
+ACCOUNT_PATH = "/fapi/v2/account"
+
+# Signed POST params are sent as a form body
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
 # Logging setup (module-level)
 logger = logging.getLogger("BasicBot")
-logger.setLevel(logging.DEBUG)
+# DEBUG by default; set BOT_LOG_LEVEL=INFO (or higher) to skip request/response
+# debug logging, including decoding response bodies for the log
+logger.setLevel((os.environ.get("BOT_LOG_LEVEL") or "DEBUG").upper())
 _formatter = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
 
 _console = logging.StreamHandler()
@@ -30,10 +52,76 @@ logger.addHandler(_console)
 
 _file = logging.FileHandler("bot_logs.log")
 _file.setFormatter(_formatter)
-logger.addHandler(_file)
+# Buffer file writes; flushed on WARNING+, when full, and by logging.shutdown() at exit
+_buffered = MemoryHandler(capacity=256, flushLevel=logging.WARNING, target=_file)
+logger.addHandler(_buffered)
+
+# Pre-rendered order queries (fixed field order); only the {fields} vary per order,
+# so no params dict has to be urlencoded. Values must already be URL-safe.
+_MARKET_QS = (
+    "symbol={sym}&side={side}&type=MARKET&quantity={qty}&reduceOnly={ro}"
+    "&newClientOrderId={cid}&timestamp={ts}&recvWindow={rw}"
+).format_map
+_LIMIT_QS = (
+    "symbol={sym}&side={side}&type=LIMIT&quantity={qty}&price={price}&timeInForce={tif}"
+    "&newClientOrderId={cid}&timestamp={ts}&recvWindow={rw}"
+).format_map
+_STOP_LIMIT_QS = (
+    "symbol={sym}&side={side}&type=STOP&quantity={qty}&price={price}&stopPrice={stop}"
+    "&timeInForce={tif}&newClientOrderId={cid}&timestamp={ts}&recvWindow={rw}"
+).format_map
+
+# Binance expects lowercase booleans in query strings
+_BOOL = {True: "true", False: "false"}
+
+_EIGHT_DP = Decimal("1e-8")
+
+
+def _fnum(x) -> str:
+    """
+    Format a quantity/price as a short fixed-point string with at most 8 decimals
+    (no float repr noise like 0.30000000000000004). Raises ValueError for
+    non-finite values, or if rounding to 8 decimals would change the value or give zero.
+    """
+    if not isinstance(x, Decimal):
+        x = float(x)
+    if not (x.is_finite() if isinstance(x, Decimal) else math.isfinite(x)):
+        raise ValueError(f"{x!r} is not a finite number")
+    try:
+        if isinstance(x, Decimal):
+            q = x.quantize(_EIGHT_DP)
+            exact = q == x
+        else:
+            q = Decimal(format(x, ".8f"))
+            # tolerate float representation noise, not real digits beyond 8 decimals
+            exact = math.isclose(float(q), x, rel_tol=1e-12)
+    except InvalidOperation as e:  # e.g. too many digits for the decimal context
+        raise ValueError(f"{x!r} cannot be sent with 8 decimals") from e
+    if not exact or not q:
+        raise ValueError(f"{x!r} cannot be sent with 8 decimals without rounding (or rounds to zero)")
+    return format(q, "f").rstrip("0").rstrip(".")
+
+
+# How long get_account_info() reuses its last response (seconds)
+ACCOUNT_CACHE_TTL = 1.0
 
 
-class BasicBot:
+def _now_ms() -> int:
+    """Current epoch time in milliseconds (integer math, no float roundtrip)"""
+    return time.time_ns() // 1_000_000
+
+
+class _SignedClient:
+    """
+    Transport-independent part of the bots: credentials, request signing,
+    order query building (pre-rendered templates) and the account cache. BasicBot (requests) and
+    async_bot.AsyncBasicBot (aiohttp) add the HTTP layer on top.
+
+    The _*_signer methods return a zero-argument callable producing
+    (query_string, signed_query_string); transports call it right before
+    sending so the timestamp is fresh.
+    """
+
     def __init__(self, api_key: str, api_secret: str, base_url: str = BASE_URL, recv_window: int = 5000):
         if not api_key or not api_secret:
             raise ValueError("API key and secret must be provided.")
@@ -41,95 +129,184 @@ class BasicBot:
         self.api_secret = api_secret.encode("utf-8")
         self.base_url = base_url.rstrip("/")
         self.recv_window = recv_window
+        # keyed HMAC state (ipad/opad already absorbed), copied per signature
+        self._hmac = hmac.new(self.api_secret, digestmod=hashlib.sha256)
+        # (monotonic request start time, response) of the last get_account_info()
+        self._acct_cache = (0.0, None)
+        # bumped before every order POST; lets an in-flight account GET detect it
+        self._orders_sent = 0
+        # client order id nonce; itertools.count keeps next() atomic across threads.
+        # Random low bits keep bots/processes started in the same millisecond apart.
+        self._nonce = itertools.count((_now_ms() << 32) | int.from_bytes(os.urandom(4), "big"))
+
+    def _client_id(self) -> str:
+        """
+        Return a new unique newClientOrderId, used when the caller did not pass
+        client_order_id. The id is logged with the "Placing ... order" line so an
+        order whose response was lost can be looked up
+        (GET /fapi/v1/order?origClientOrderId=...). Binance only enforces
+        uniqueness among open orders, so the id does not make re-sending an order safe.
+        """
+        return f"bb{next(self._nonce):x}"
+
+    def _sign(self, query_string: str) -> str:
+        """Return signature string for an already urlencoded query string"""
+        h = self._hmac.copy()
+        h.update(query_string.encode("ascii"))  # urlencode output is always ASCII
+        return h.hexdigest()
+
+    def _signed_query(self, extra: dict):
+        """
+        Add timestamp and recvWindow to extra, encode it once and sign it.
+        Returns (query_string, signed_query_string).
+        """
+        extra["timestamp"] = _now_ms()
+        extra["recvWindow"] = self.recv_window
+        qs = urlencode(extra, doseq=True)
+        return qs, f"{qs}&signature={self._sign(qs)}"
+
+    def _signed_template(self, render, fields: dict):
+        """Render an order template with fresh timestamp/recvWindow and sign it; returns (qs, signed_qs)"""
+        fields["ts"] = _now_ms()
+        fields["rw"] = self.recv_window
+        qs = render(fields)
+        return qs, f"{qs}&signature={self._sign(qs)}"
+
+    def _order_fields(self, symbol: str, side: str, quantity, client_order_id) -> dict:
+        """Fields shared by every order template"""
+        return {
+            "sym": quote_plus(symbol.upper()),
+            "side": quote_plus(side.upper()),  # BUY or SELL
+            "qty": _fnum(quantity),
+            "cid": quote_plus(client_order_id or self._client_id()),
+        }
+
+    def _market_signer(self, symbol: str, side: str, quantity, reduce_only: bool, client_order_id):
+        fields = self._order_fields(symbol, side, quantity, client_order_id)
+        fields["ro"] = _BOOL[bool(reduce_only)]
+        logger.info("Placing MARKET order: %s %s %s (clientOrderId=%s)", side, quantity, symbol, fields["cid"])
+        return functools.partial(self._signed_template, _MARKET_QS, fields)
+
+    def _limit_signer(self, symbol: str, side: str, quantity, price, time_in_force: str, client_order_id):
+        fields = self._order_fields(symbol, side, quantity, client_order_id)
+        fields["price"] = _fnum(price)
+        fields["tif"] = quote_plus(time_in_force)
+        logger.info("Placing LIMIT order: %s %s %s @ %s (clientOrderId=%s)", side, quantity, symbol, price, fields["cid"])
+        return functools.partial(self._signed_template, _LIMIT_QS, fields)
+
+    def _stop_limit_signer(self, symbol: str, side: str, quantity, stop_price, limit_price, time_in_force: str, client_order_id):
+        fields = self._order_fields(symbol, side, quantity, client_order_id)
+        fields["price"] = _fnum(limit_price)
+        fields["stop"] = _fnum(stop_price)
+        fields["tif"] = quote_plus(time_in_force)
+        logger.info("Placing STOP-LIMIT order: %s %s %s stop=%s limit=%s (clientOrderId=%s)", side, quantity, symbol, stop_price, limit_price, fields["cid"])
+        return functools.partial(self._signed_template, _STOP_LIMIT_QS, fields)
+
+    def _order_sending(self):
+        """Call right before an order POST: drop cached balances (even a failed order may execute)"""
+        self._orders_sent += 1
+        self._acct_cache = (0.0, None)
+
+    def _store_account(self, started: float, orders_before: int, data):
+        """Cache an account response unless an order was sent while its request was in flight"""
+        if self._orders_sent == orders_before:
+            self._acct_cache = (started, data)
+
+    def _cached_account(self, force: bool):
+        """Return the cached account response if it is younger than ACCOUNT_CACHE_TTL"""
+        fetched_at, data = self._acct_cache
+        if not force and data is not None and time.monotonic() - fetched_at < ACCOUNT_CACHE_TTL:
+            return data
+        return None
+
+
+class BasicBot(_SignedClient):
+    def __init__(self, api_key: str, api_secret: str, base_url: str = BASE_URL, recv_window: int = 5000):
+        super().__init__(api_key, api_secret, base_url=base_url, recv_window=recv_window)
         self.session = requests.Session()
-        self.session.headers.update({"X-MBX-APIKEY": self.api_key})
+        # keep-alive pool so repeated calls reuse one TCP+TLS connection.
+        # Read/status retries only apply to GET: a POSTed order may already have
+        # executed after a read timeout or 5xx, so POST is retried only when the
+        # connection could not be established. raise_on_status=False lets the
+        # final 429/5xx response reach raise_for_status() with Binance's error.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=16, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"X-MBX-APIKEY": self.api_key, "Connection": "keep-alive"})
         logger.info("BasicBot initialized")
 
-    def _sign(self, params: dict) -> str:
-        """Return signature string for params dict (query string)"""
-        query_string = urlencode(params, doseq=True)
-        signature = hmac.new(self.api_secret, query_string.encode("utf-8"), hashlib.sha256).hexdigest()
-        return signature
-
-    def _post(self, path: str, params: dict):
+    def _send_post(self, path: str, sign):
+        """POST the form body produced by sign(); its unsigned query string is only logged"""
         url = f"{self.base_url}{path}"
-        params["timestamp"] = int(time.time() * 1000)
-        params["recvWindow"] = self.recv_window
-        params["signature"] = self._sign(params)
-        logger.debug("REQUEST POST %s?%s", url, urlencode({k: v for k, v in params.items() if k != "signature"}))
+        qs, body = sign()
+        logger.debug("REQUEST POST %s?%s", url, qs)
+        self._order_sending()
         try:
-            resp = self.session.post(url, params=params, timeout=10)
-            logger.debug("STATUS %s | RESPONSE %s", resp.status_code, resp.text)
+            resp = self.session.post(url, data=body, headers=_FORM_HEADERS, timeout=10)
+            if logger.isEnabledFor(logging.DEBUG):  # skip decoding resp.text unless BOT_LOG_LEVEL=DEBUG
+                logger.debug("STATUS %s | RESPONSE %s", resp.status_code, resp.text)
             resp.raise_for_status()
-            return resp.json()
-        except requests.RequestException as e:
+            return _loads(resp.content)
+        except (requests.RequestException, ValueError) as e:  # ValueError: bad JSON body
             logger.exception("Request failed: %s", str(e))
             raise
 
-    def place_market_order(self, symbol: str, side: str, quantity: float, reduce_only: bool = False):
+    def place_market_order(self, symbol: str, side: str, quantity: float, reduce_only: bool = False, client_order_id: str = None):
         """
         Place a market order on futures endpoint:
         side: BUY or SELL
+        client_order_id: newClientOrderId to send (generated when omitted)
         """
-        path = "/fapi/v1/order"
-        params = {
-            "symbol": symbol.upper(),
-            "side": side.upper(),  # BUY or SELL
-            "type": "MARKET",
-            "quantity": float(quantity),
-            "reduceOnly": str(reduce_only).lower(),  # lowercase 'true'/'false'
-        }
-        logger.info("Placing MARKET order: %s %s %s", side, quantity, symbol)
-        return self._post(path, params)
+        signer = self._market_signer(symbol, side, quantity, reduce_only, client_order_id)
+        return self._send_post(ORDER_PATH, signer)
 
-    def place_limit_order(self, symbol: str, side: str, quantity: float, price: float, time_in_force: str = "GTC"):
+    def place_limit_order(self, symbol: str, side: str, quantity: float, price: float, time_in_force: str = "GTC", client_order_id: str = None):
         """
         Place a limit order:
         time_in_force: GTC / IOC / FOK
+        client_order_id: newClientOrderId to send (generated when omitted)
         """
-        path = "/fapi/v1/order"
-        params = {
-            "symbol": symbol.upper(),
-            "side": side.upper(),
-            "type": "LIMIT",
-            "quantity": float(quantity),
-            "price": float(price),
-            "timeInForce": time_in_force,
-        }
-        logger.info("Placing LIMIT order: %s %s %s @ %s", side, quantity, symbol, price)
-        return self._post(path, params)
+        signer = self._limit_signer(symbol, side, quantity, price, time_in_force, client_order_id)
+        return self._send_post(ORDER_PATH, signer)
 
-    def place_stop_limit_order(self, symbol: str, side: str, quantity: float, stop_price: float, limit_price: float, time_in_force: str = "GTC"):
+    def place_stop_limit_order(self, symbol: str, side: str, quantity: float, stop_price: float, limit_price: float, time_in_force: str = "GTC", client_order_id: str = None):
         """
         Stop-Limit: trigger at stop_price, place a LIMIT at limit_price.
         For Futures this uses type=STOP and closePosition false (or type=STOP_MARKET for stop-market).
         We'll implement using stopPrice and type=STOP (the behavior depends on API flags).
+        client_order_id: newClientOrderId to send (generated when omitted)
         """
-        path = "/fapi/v1/order"
-        params = {
-            "symbol": symbol.upper(),
-            "side": side.upper(),
-            "type": "STOP",
-            "quantity": float(quantity),
-            "price": float(limit_price),
-            "stopPrice": float(stop_price),
-            "timeInForce": time_in_force,
-        }
-        logger.info("Placing STOP-LIMIT order: %s %s %s stop=%s limit=%s", side, quantity, symbol, stop_price, limit_price)
-        return self._post(path, params)
+        signer = self._stop_limit_signer(symbol, side, quantity, stop_price, limit_price, time_in_force, client_order_id)
+        return self._send_post(ORDER_PATH, signer)
 
     # Utility: get account/futures position (optional)
-    def get_account_info(self):
-        path = "/fapi/v2/account"
-        params = {"timestamp": int(time.time() * 1000), "recvWindow": self.recv_window}
-        params["signature"] = self._sign(params)
-        url = f"{self.base_url}{path}"
-        logger.debug("REQUEST GET %s?%s", url, urlencode({k: v for k, v in params.items() if k != "signature"}))
+    def get_account_info(self, force: bool = False):
+        """
+        Fetch account info. Responses are reused for ACCOUNT_CACHE_TTL seconds
+        (and dropped whenever an order is sent); pass force=True to always hit the API.
+        Cached responses are the same dict for every caller: copy before mutating.
+        """
+        cached = self._cached_account(force)
+        if cached is not None:
+            return cached
+        qs, signed = self._signed_query({})
+        url = f"{self.base_url}{ACCOUNT_PATH}"
+        logger.debug("REQUEST GET %s?%s", url, qs)
+        started, orders_before = time.monotonic(), self._orders_sent
         try:
-            resp = self.session.get(url, params=params, timeout=10)
-            logger.debug("STATUS %s | RESPONSE %s", resp.status_code, resp.text)
+            resp = self.session.get(f"{url}?{signed}", timeout=10)
+            if logger.isEnabledFor(logging.DEBUG):  # skip decoding resp.text unless BOT_LOG_LEVEL=DEBUG
+                logger.debug("STATUS %s | RESPONSE %s", resp.status_code, resp.text)
             resp.raise_for_status()
-            return resp.json()
-        except requests.RequestException as e:
+            data = _loads(resp.content)
+            self._store_account(started, orders_before, data)
+            return data
+        except (requests.RequestException, ValueError) as e:  # ValueError: bad JSON body
             logger.exception("Failed to fetch account info: %s", e)
             raise
@@ -25,6 +25,7 @@ def main():
     parser.add_argument("--price", type=positive_float, help="Price for LIMIT order")
     parser.add_argument("--stop-price", dest="stop_price", type=positive_float, help="Stop price for STOPLIMIT")
     parser.add_argument("--time-in-force", dest="tif", default="GTC", choices=["GTC","IOC","FOK"], help="Time in force for LIMIT")
+    parser.add_argument("--client-order-id", dest="client_order_id", help="newClientOrderId to send (generated if omitted)")
     args = parser.parse_args()
 
     api_key = os.environ.get("BINANCE_API_KEY")
@@ -37,17 +38,17 @@ def main():
 
     try:
         if args.type == "MARKET":
-            res = bot.place_market_order(args.symbol, args.side, args.quantity)
+            res = bot.place_market_order(args.symbol, args.side, args.quantity, client_order_id=args.client_order_id)
         elif args.type == "LIMIT":
             if not args.price:
                 logger.error("LIMIT order requires --price")
                 parser.exit(1)
-            res = bot.place_limit_order(args.symbol, args.side, args.quantity, args.price, time_in_force=args.tif)
+            res = bot.place_limit_order(args.symbol, args.side, args.quantity, args.price, time_in_force=args.tif, client_order_id=args.client_order_id)
         elif args.type == "STOPLIMIT":
             if not args.stop_price or not args.price:
                 logger.error("STOPLIMIT requires --stop-price and --price")
                 parser.exit(1)
-            res = bot.place_stop_limit_order(args.symbol, args.side, args.quantity, args.stop_price, args.price, time_in_force=args.tif)
+            res = bot.place_stop_limit_order(args.symbol, args.side, args.quantity, args.stop_price, args.price, time_in_force=args.tif, client_order_id=args.client_order_id)
         else:
             logger.error("Unknown order type")
             parser.exit(1)
@@ -0,0 +1,42 @@
+"""
+test_bot.py
+Unit tests for the order value formatting in bot.py (no network access).
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from bot import _fnum
+
+
+@pytest.mark.parametrize("value, expected", [
+    (0.1 + 0.2, "0.3"),
+    (30000, "30000"),
+    (1.5, "1.5"),
+    ("2.25", "2.25"),
+    (0.00000001, "0.00000001"),
+    (Decimal("0.001"), "0.001"),
+    (Decimal("1E+3"), "1000"),
+])
+def test_fnum_accepts(value, expected):
+    assert _fnum(value) == expected
+
+
+@pytest.mark.parametrize("value", [
+    0,
+    1e-9,
+    1.123456789,
+    float("inf"),
+    float("-inf"),
+    float("nan"),
+    Decimal("1E-9"),
+    Decimal("0.123456789"),
+    Decimal("1E+30"),
+    Decimal("Infinity"),
+    Decimal("NaN"),
+    Decimal("sNaN"),
+])
+def test_fnum_rejects(value):
+    with pytest.raises(ValueError):
+        _fnum(value)